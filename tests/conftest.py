@@ -0,0 +1,43 @@
+import asyncio
+import pytest_asyncio
+
+from trinnov_altitude.mocks import MockTrinnovAltitudeServer
+from trinnov_altitude.trinnov_altitude import TrinnovAltitude
+
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+@pytest_asyncio.fixture(scope="session")
+async def mock_server_session():
+    server = MockTrinnovAltitudeServer()
+    await server.start_server()
+    yield server
+    await server.stop_server()
+
+
+@pytest_asyncio.fixture
+async def mock_server(mock_server_session):
+    mock_server_session.reset()
+    yield mock_server_session
+
+
+@pytest_asyncio.fixture
+async def client(mock_server):
+    client = TrinnovAltitude(host="localhost", port=mock_server.port)
+    yield client
+    await client.stop_listening()
+    if client.connected():
+        await client.disconnect()
+
+
+@pytest_asyncio.fixture
+async def connected_client(client):
+    await client.connect()
+    client.start_listening()
+    await client.wait_for_initial_sync()
+    yield client
@@ -0,0 +1,76 @@
+import pytest
+
+from trinnov_altitude import messages
+
+
+@pytest.mark.parametrize(
+    "raw_message,expected_type,expected_attributes",
+    [
+        ("BYPASS 1", messages.BypassMessage, {"state": True}),
+        ("CURRENT_PRESET -1", messages.CurrentPresetMessage, {"index": 0}),
+        (
+            "DECODER NONAUDIO 1 PLAYABLE 0 DECODER none UPMIXER dolby",
+            messages.DecoderMessage,
+            {
+                "nonaudio": True,
+                "playable": False,
+                "decoder": "none",
+                "upmixer": "dolby",
+            },
+        ),
+        ("ERROR: invalid command", messages.ErrorMessage, {"error": "invalid command"}),
+        ("LABEL 1: MLP", messages.PresetMessage, {"index": 1, "name": "MLP"}),
+        ("LABELS_CLEAR", messages.PresetsClearMessage, {}),
+        ("OK", messages.OKMessage, {}),
+        ("PROFILES_CLEAR", messages.SourcesClearMessage, {}),
+        (
+            "PROFILE 24: ANALOG BAL IN 1+2 (MIC 4 XLR)",
+            messages.SourceMessage,
+            {"index": 24, "name": "ANALOG BAL IN 1+2 (MIC 4 XLR)"},
+        ),
+        ("SRATE 48000", messages.SamplingRateMessage, {"rate": 48000}),
+        ("VOLUME -40.5", messages.VolumeMessage, {"volume": -40.5}),
+        (
+            "Welcome on Trinnov Optimizer (Version 4.3.2rc1, ID 10485761)",
+            messages.WelcomeMessage,
+            {"version": "4.3.2rc1", "id": "10485761"},
+        ),
+    ],
+)
+def test_message_factory(raw_message, expected_type, expected_attributes):
+    message = messages.message_factory(raw_message)
+    assert isinstance(message, expected_type)
+    for name, value in expected_attributes.items():
+        assert getattr(message, name) == value
+
+
+@pytest.mark.parametrize(
+    "raw_message",
+    [
+        "BYPASS 2",
+        "LABEL 1",
+        "AUDIOSYNC",
+        "CURRENT_SOURCE_FORMAT_NAME",
+        "ERROR:",
+        "SRATE unknown",
+        "VOLUME nan",
+        "VOLUME inf",
+        "VOLUME 1e9",
+        "VOLUME 1_0",
+        "MON_VOL -40.0",
+        "Welcome on Trinnov Optimizer (Version 4.3.2rc1)",
+    ],
+)
+def test_message_factory_unknown(raw_message):
+    message = messages.message_factory(raw_message)
+    assert isinstance(message, messages.UnknownMessage)
+    assert message.raw_message == raw_message
+
+
+def test_messages_are_hashable_and_immutable():
+    message = messages.message_factory("OK")
+    assert hash(message) == hash(messages.message_factory("OK"))
+    assert {messages.message_factory("VOLUME -40.0")}
+
+    with pytest.raises(AttributeError):
+        messages.message_factory("VOLUME -40.0").volume = 0
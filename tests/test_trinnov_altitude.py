@@ -1,34 +1,37 @@
 import asyncio
 import pytest
-import pytest_asyncio
+import socket
 
+from trinnov_altitude.const import RemappingMode, UpmixerMode
 from trinnov_altitude.exceptions import (
     ConnectionFailedError,
     ConnectionTimeoutError,
     InvalidMacAddressOUIError,
     MalformedMacAddressError,
+    NotConnectedError,
 )
-from trinnov_altitude.messages import Message
+from trinnov_altitude.messages import Message, MuteMessage
 from trinnov_altitude.mocks import MockTrinnovAltitudeServer
 from trinnov_altitude.trinnov_altitude import TrinnovAltitude
 
 
-@pytest_asyncio.fixture
-async def mock_server():
-    server = MockTrinnovAltitudeServer()
-    await server.start_server()
-    yield server
-    await server.stop_server()
+async def _wait_for(client, predicate, timeout=1):
+    """Wait until `predicate` holds, re-checking whenever the client emits an event."""
+    changed = asyncio.Event()
 
+    def _on_change(event: str, message: Message | None = None):
+        changed.set()
 
-@pytest_asyncio.fixture
-async def connected_client():
-    client = TrinnovAltitude(host="localhost")
-    await client.connect()
-    client.start_listening()
-    yield client
-    await client.stop_listening()
-    await client.disconnect()
+    async def _wait():
+        while not predicate():
+            await changed.wait()
+            changed.clear()
+
+    client.register_callback(_on_change)
+    try:
+        await asyncio.wait_for(_wait(), timeout)
+    finally:
+        client.deregister_callback(_on_change)
 
 
 @pytest.mark.asyncio
@@ -36,7 +39,23 @@ async def test_validate_mac():
     with pytest.raises(MalformedMacAddressError):
         TrinnovAltitude.validate_mac("malformed")
 
+    with pytest.raises(MalformedMacAddressError):
+        TrinnovAltitude.validate_mac("c8:7f:54:7a:eb:cg")
+
+    with pytest.raises(MalformedMacAddressError):
+        TrinnovAltitude.validate_mac("c8.7f.54.7a.eb.c2")
+
     assert TrinnovAltitude.validate_mac("c8:7f:54:7a:eb:c2")
+    assert TrinnovAltitude.validate_mac("C8-7F-54-7A-EB-C2")
+
+
+def test_mode_lookup_is_case_insensitive():
+    assert UpmixerMode("DOLBY") is UpmixerMode.MODE_DOLBY
+    assert RemappingMode("2d") is RemappingMode.MODE_2D
+    assert len(set(UpmixerMode)) == len(UpmixerMode.__members__)
+
+    with pytest.raises(ValueError):
+        UpmixerMode("invalid")
 
 
 @pytest.mark.asyncio
@@ -54,16 +73,20 @@ async def test_connect_timeout(mock_server):
 
 
 @pytest.mark.asyncio
-async def test_connect_success(mock_server):
-    client = TrinnovAltitude(host="localhost", port=mock_server.port)
+async def test_connect_success(client):
     await client.connect()
     assert client.connected() is True
-    await client.disconnect()
 
 
 @pytest.mark.asyncio
-async def test_register_callback(mock_server):
-    client = TrinnovAltitude(host="localhost", port=mock_server.port)
+async def test_connect_sets_nodelay(client):
+    await client.connect()
+    sock = client._writer.get_extra_info("socket")
+    assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+
+
+@pytest.mark.asyncio
+async def test_register_callback(client):
     client._last_event = None  # type: ignore
 
     def _update(event: str, message: Message | None = None):
@@ -74,15 +97,13 @@ async def test_register_callback(mock_server):
     await client.connect()
     client.start_listening()
     await client.wait_for_initial_sync()
-    await client.stop_listening()
-    await client.disconnect()
 
     assert client._last_event  # type: ignore
 
 
 @pytest.mark.asyncio
-async def test_start_listening_syncs(mock_server, connected_client):
-    await asyncio.sleep(0.5)
+async def test_start_listening_syncs(connected_client):
+    await _wait_for(connected_client, lambda: connected_client.preset is not None)
     assert connected_client.audiosync == "Slave"
     assert connected_client.bypass is False
     assert connected_client.decoder == "none"
@@ -98,11 +119,12 @@ async def test_start_listening_syncs(mock_server, connected_client):
 
 
 @pytest.mark.asyncio
-async def test_start_listening_reconnects(mock_server, connected_client):
+async def test_start_listening_reconnects(connected_client):
     await connected_client.disconnect()
     assert not connected_client.connected()
-    await asyncio.sleep(0.5)
-    assert connected_client.connected()
+    assert connected_client.volume is None
+    assert connected_client.source is None
+    await _wait_for(connected_client, connected_client.connected)
 
 
 # --------------------------
@@ -111,28 +133,148 @@ async def test_start_listening_reconnects(mock_server, connected_client):
 
 
 @pytest.mark.asyncio
-async def test_power_off(mock_server, connected_client):
-    await connected_client.power_off()
-    await asyncio.sleep(1)
-    assert not connected_client.connected()
+async def test_power_off():
+    # Powering off shuts the mock down, so use a dedicated server rather than
+    # the shared one.
+    server = MockTrinnovAltitudeServer(port=TrinnovAltitude.DEFAULT_PORT + 1)
+    await server.start_server()
+    client = TrinnovAltitude(host="localhost", port=server.port)
+    await client.connect()
+    client.start_listening()
+
+    try:
+        await client.power_off()
+        await _wait_for(client, lambda: not client.connected())
+    finally:
+        await client.stop_listening()
+        await server.stop_server()
 
 
 @pytest.mark.asyncio
-async def test_volume_adjust(mock_server, connected_client):
+async def test_volume_adjust(connected_client):
     await connected_client.volume_adjust(2)
-    await asyncio.sleep(0.5)
+    await _wait_for(connected_client, lambda: connected_client.volume == -38.0)
     assert connected_client.volume == -38.0
 
 
 @pytest.mark.asyncio
-async def test_volume_percentage_set(mock_server, connected_client):
+async def test_volume_percentage_set(connected_client):
     await connected_client.volume_percentage_set(52.86)
-    await asyncio.sleep(0.5)
+    await _wait_for(connected_client, lambda: connected_client.volume == -46.0)
     assert connected_client.volume == -46.0
 
 
 @pytest.mark.asyncio
-async def test_volume_set(mock_server, connected_client):
+async def test_volume_set(connected_client):
     await connected_client.volume_set(-46)
-    await asyncio.sleep(0.5)
+    await _wait_for(connected_client, lambda: connected_client.volume == -46.0)
     assert connected_client.volume == -46.0
+
+
+@pytest.mark.asyncio
+async def test_deregister_callback_while_dispatching(connected_client):
+    def _once(event: str, message: Message | None = None):
+        connected_client.deregister_callback(_once)
+
+    connected_client.register_callback(_once)
+    await connected_client.volume_set(-46)
+    await _wait_for(connected_client, lambda: connected_client.volume == -46.0)
+    assert _once not in connected_client._callbacks
+
+
+@pytest.mark.asyncio
+async def test_source_set_by_name(connected_client):
+    await _wait_for(connected_client, lambda: connected_client.source is not None)
+    await connected_client.source_set_by_name("PS 5")
+    await _wait_for(connected_client, lambda: connected_client.source == "PS 5")
+    assert connected_client.source == "PS 5"
+
+
+@pytest.mark.asyncio
+async def test_mute_set(connected_client):
+    await connected_client.mute_set(True)
+    await _wait_for(connected_client, lambda: connected_client.mute is True)
+    await connected_client.mute_set(False)
+    await _wait_for(connected_client, lambda: connected_client.mute is False)
+
+
+def test_source_resolves_names_received_later():
+    client = TrinnovAltitude(host="localhost")
+    client._process_message("CURRENT_PROFILE 1")
+    assert client.source is None
+
+    client._process_message("PROFILE 1: Apple TV")
+    assert client.source == "Apple TV"
+
+
+@pytest.mark.asyncio
+async def test_mute_toggle(connected_client):
+    await connected_client.mute_toggle()
+    await _wait_for(connected_client, lambda: connected_client.mute is True)
+    await connected_client.mute_toggle()
+    await _wait_for(connected_client, lambda: connected_client.mute is False)
+
+
+@pytest.mark.asyncio
+async def test_source_set_by_name_after_rename(connected_client):
+    await _wait_for(connected_client, lambda: connected_client.source is not None)
+    connected_client._process_message("PROFILE 1: Kodi")
+    connected_client._process_message("PROFILE 2: Apple TV")
+
+    await connected_client.source_set_by_name("Apple TV")
+    await _wait_for(connected_client, lambda: connected_client._source_index == 2)
+    assert connected_client.source == "Apple TV"
+
+
+@pytest.mark.asyncio
+async def test_mute_set_truthy_state(connected_client):
+    await connected_client.mute_set(1)
+    await _wait_for(connected_client, lambda: connected_client.mute is True)
+    await connected_client.mute_set(0)
+    await _wait_for(connected_client, lambda: connected_client.mute is False)
+
+
+@pytest.mark.asyncio
+async def test_front_display_commands():
+    client = TrinnovAltitude(host="localhost")
+    sent = []
+
+    async def write_bytes(data, timeout, terminator=b""):
+        sent.append(data)
+
+    client._write_bytes = write_bytes
+    await client.front_display_on()
+    await client.front_display_off()
+    await client.front_display_toggle()
+    assert sent == [b"fav_light 0\n", b"fav_light 1\n", b"fav_light 2\n"]
+
+
+@pytest.mark.asyncio
+async def test_read_joins_lines_split_across_reads():
+    client = TrinnovAltitude(host="localhost")
+    client._reader = asyncio.StreamReader()
+
+    client._reader.feed_data(b"VOLUME -4")
+    assert await client._read() == []
+
+    client._reader.feed_data(b"0.0\nMUTE 1\n")
+    await client._read()
+    assert client.volume == -40.0
+    assert client.mute is True
+
+
+@pytest.mark.asyncio
+async def test_read_rejects_overlong_lines():
+    client = TrinnovAltitude(host="localhost")
+    client._reader = asyncio.StreamReader()
+    # Receive the overlong line in the same read as a complete one
+    client.READ_SIZE = 2 * TrinnovAltitude.READ_LIMIT
+    received = []
+    client.register_callback(lambda event, message: received.append(message))
+    client._reader.feed_data(b"MUTE 1\n" + b"x" * TrinnovAltitude.READ_LIMIT + b"x")
+
+    with pytest.raises(NotConnectedError):
+        await client._read()
+
+    # Complete lines from that read are still processed
+    assert received == [MuteMessage(True)]
@@ -1,9 +1,6 @@
 import logging
-import os
 
-log_level = os.getenv("LOG_LEVEL", "info")
-level = logging.getLevelName(log_level.upper())
-log_format = "[L %(lineno)s - %(funcName)5s() ] %(message)s"
-logging.basicConfig(level=level, format=log_format)
+# Leave logging configuration to the application using the library.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 __version__ = "1.2.4"
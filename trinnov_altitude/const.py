@@ -1,31 +1,39 @@
 from enum import Enum
 
 
-class RemappingMode(Enum):
-    MODE_NONE = ("none", "Disable the remapping mode.")
-    MODE_2D = ("2D", "The 2D remapping mode.")
-    MODE_3D = ("3D", "The 3D remapping mode.")
-    MODE_AUTOROTATE = ("autorotate", "The autoratating remapping mode.")
-    MODE_MANUAL = ("manual", "The manual remapping mode.")
-
+class _DocumentedEnum(Enum):
     def __new__(cls, value, doc):
         obj = object.__new__(cls)
         obj._value_ = value
         obj.__doc__ = doc
         return obj
 
+    @classmethod
+    def _missing_(cls, value):
+        # Exact values are resolved by Enum's own value map, this is only
+        # reached for lookups that differ in case, e.g. `RemappingMode("2d")`.
+        if isinstance(value, str):
+            value = value.casefold()
+            for member in cls:
+                if member.value.casefold() == value:
+                    return member
 
-class UpmixerMode(Enum):
-    MODE_AUTO = ("none", "Disable the remapping mode.")
-    MODE_AURO3D = ("none", "Disable the remapping mode.")
-    MODE_DTS = ("2D", "The 2D remapping mode.")
-    MODE_DOLBY = ("3D", "The 3D remapping mode.")
-    MODE_NATIVE = ("3D", "The 3D remapping mode.")
-    MODE_LEGACY = ("autorotate", "The autoratating remapping mode.")
-    MODE_UPMIX_ON_NATIVE = ("manual", "The manual remapping mode.")
+        return None
 
-    def __new__(cls, value, doc):
-        obj = object.__new__(cls)
-        obj._value_ = value
-        obj.__doc__ = doc
-        return obj
+
+class RemappingMode(_DocumentedEnum):
+    MODE_NONE = ("none", "Disable the remapping mode.")
+    MODE_2D = ("2D", "The 2D remapping mode.")
+    MODE_3D = ("3D", "The 3D remapping mode.")
+    MODE_AUTOROTATE = ("autorotate", "The autoratating remapping mode.")
+    MODE_MANUAL = ("manual", "The manual remapping mode.")
+
+
+class UpmixerMode(_DocumentedEnum):
+    MODE_AUTO = ("auto", "Select the upmixer automatically.")
+    MODE_AURO3D = ("auro3d", "The Auro-3D upmixer.")
+    MODE_DTS = ("dts", "The DTS Neural:X upmixer.")
+    MODE_DOLBY = ("dolby", "The Dolby Surround upmixer.")
+    MODE_NATIVE = ("native", "The native Trinnov upmixer.")
+    MODE_LEGACY = ("legacy", "The legacy Trinnov upmixer.")
+    MODE_UPMIX_ON_NATIVE = ("upmix on native", "Upmix on native channels.")
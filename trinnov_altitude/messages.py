@@ -1,167 +1,241 @@
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
 
 
-def message_factory(message) -> Message:  # noqa: C901
-    if match := re.match(r"^AUDIOSYNC\s(.*)", message):
-        mode = match.group(1)
-        return AudiosyncMessage(mode)
-    elif match := re.match(r"^BYPASS\s(0|1)", message):
-        state = bool(int(match.group(1)))
-        return BypassMessage(state)
-    elif match := re.match(r"^CURRENT_PRESET\s(-?\d+)", message):
-        # A -1 will be sent, which means the built-in preset is being used
-        state = max(0, int(match.group(1)))
-        return CurrentPresetMessage(state)
-    elif match := re.match(r"^CURRENT_PROFILE\s(-?\d+)", message):
-        state = int(match.group(1))
-        return CurrentSourceMessage(state)
-    elif match := re.match(r"^CURRENT_SOURCE_FORMAT_NAME\s(.*)", message):
-        format = match.group(1)
-        return CurrentSourceFormat(format)
-    elif match := re.match(
-        r"^DECODER NONAUDIO (\d+) PLAYABLE (\d+) DECODER (\w+) UPMIXER (\w+)", message
-    ):
-        nonaudio = bool(int(match.group(1)))
-        playable = bool(int(match.group(2)))
-        decoder = match.group(3)
-        upmixer = match.group(4)
-        return DecoderMessage(nonaudio, playable, decoder, upmixer)
-    elif match := re.match(r"^DIM\s(-?\d+)", message):
-        state = bool(int(match.group(1)))
-        return DimMessage(state)
-    elif match := re.match(r"^ERROR: (.*)", message):
-        error = match.group(1)
-        return ErrorMessage(error)
-    elif match := re.match(r"^LABEL\s(-?\d+): (.*)", message):
-        index = int(match.group(1))
-        name = match.group(2)
-        return PresetMessage(index, name)
-    elif match := re.match(r"^LABELS_CLEAR", message):
-        return PresetsClearMessage()
-    elif match := re.match(r"^MUTE\s(0|1)", message):
-        state = bool(int(match.group(1)))
-        return MuteMessage(state)
-    elif match := re.match(r"^OK", message):
-        return OKMessage()
-    elif match := re.match(r"^PROFILE\s(-?\d+): (.*)", message):
-        index = int(match.group(1))
-        name = match.group(2)
-        return SourceMessage(index, name)
-    elif match := re.match(r"^PROFILES_CLEAR", message):
-        return SourcesClearMessage()
-    elif match := re.match(r"^SRATE (.*)", message):
-        rate = int(match.group(1))
-        return SamplingRateMessage(rate)
-    elif match := re.match(r"^VOLUME\s(-?\d+(\.\d+)?)", message):
-        volume = float(match.group(1))
-        return VolumeMessage(volume)
-    elif match := re.match(
-        r"^Welcome on Trinnov Optimizer \(Version (\S+), ID (\d+)\)",
-        message,
-    ):
-        version = match.group(1)
-        id = match.group(2)
-        return WelcomeMessage(version, id)
-    else:
+def message_factory(message) -> Message:
+    # Every message starts with a keyword identifying its type, so look up its
+    # parser directly and let it work on the remainder of the line.
+    keyword, separator, rest = message.partition(" ")
+    parse = _PARSERS.get(keyword)
+    if parse is None or not (separator or keyword in _BARE_KEYWORDS):
         return UnknownMessage(message)
 
+    try:
+        parsed = parse(rest)
+    except (IndexError, ValueError):
+        parsed = None
+
+    return UnknownMessage(message) if parsed is None else parsed
+
+
+def _first(rest: str) -> str:
+    return rest.partition(" ")[0]
+
+
+def _flag(rest: str) -> bool | None:
+    return _FLAGS.get(_first(rest))
+
+
+_FLAGS = {"0": False, "1": True}
+
+
+def _bypass_message(rest: str) -> Message | None:
+    state = _flag(rest)
+    return None if state is None else BypassMessage(state)
+
+
+def _decoder_message(rest: str) -> Message | None:
+    # NONAUDIO <n> PLAYABLE <n> DECODER <name> UPMIXER <name>
+    tokens = rest.split()
+    if (
+        len(tokens) < 8
+        or tokens[0] != "NONAUDIO"
+        or tokens[2] != "PLAYABLE"
+        or tokens[4] != "DECODER"
+        or tokens[6] != "UPMIXER"
+    ):
+        return None
+
+    nonaudio = bool(int(tokens[1]))
+    playable = bool(int(tokens[3]))
+    decoder = sys.intern(tokens[5])
+    upmixer = sys.intern(tokens[7])
+    return DecoderMessage(nonaudio, playable, decoder, upmixer)
+
+
+def _mute_message(rest: str) -> Message | None:
+    state = _flag(rest)
+    return None if state is None else MuteMessage(state)
+
+
+def _preset_message(rest: str) -> Message | None:
+    index, separator, name = rest.partition(": ")
+    if not separator:
+        return None
+    return PresetMessage(int(index), sys.intern(name))
+
+
+def _source_message(rest: str) -> Message | None:
+    index, separator, name = rest.partition(": ")
+    if not separator:
+        return None
+    return SourceMessage(int(index), sys.intern(name))
+
+
+# Volumes are sent in dB with an optional fractional part, e.g. "-40.5".
+# Checked up front because `float` also accepts "inf", "nan", "1e9", "1_0"...
+_VOLUME_PATTERN = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def _volume_message(rest: str) -> Message | None:
+    volume = _first(rest)
+    if _VOLUME_PATTERN.fullmatch(volume) is None:
+        return None
+
+    return VolumeMessage(float(volume))
+
+
+def _welcome_message(rest: str) -> Message | None:
+    # on Trinnov Optimizer (Version <version>, ID <id>)
+    if not rest.startswith(_WELCOME_PREFIX):
+        return None
+
+    version, separator, rest = rest.removeprefix(_WELCOME_PREFIX).partition(", ID ")
+    id, closed, _ = rest.partition(")")
+    if not version or " " in version or not id.isdigit() or not closed:
+        return None
+
+    return WelcomeMessage(version, id)
+
+
+_WELCOME_PREFIX = "on Trinnov Optimizer (Version "
+
+# Keywords sent without arguments, every other keyword must be followed by a
+# space even when its argument is free-form text.
+_BARE_KEYWORDS = frozenset({"LABELS_CLEAR", "OK", "PROFILES_CLEAR"})
+
+# Maps the leading keyword of a message to a function parsing the rest of the
+# line. Parsers return `None` (or raise `ValueError`) for malformed messages,
+# which are then reported as `UnknownMessage`. Keywords without arguments
+# carry no data, so a single shared instance is returned for them. Names and
+# modes come from a small set that is re-sent on every (re)connect and
+# state change, so they are interned to share one copy per value.
+_PARSERS: dict[str, Callable[[str], Message | None]] = {
+    "AUDIOSYNC": lambda rest: AudiosyncMessage(sys.intern(rest)),
+    "BYPASS": _bypass_message,
+    # A -1 will be sent, which means the built-in preset is being used
+    "CURRENT_PRESET": lambda rest: CurrentPresetMessage(max(0, int(_first(rest)))),
+    "CURRENT_PROFILE": lambda rest: CurrentSourceMessage(int(_first(rest))),
+    "CURRENT_SOURCE_FORMAT_NAME": lambda rest: CurrentSourceFormat(sys.intern(rest)),
+    "DECODER": _decoder_message,
+    "DIM": lambda rest: DimMessage(bool(int(_first(rest)))),
+    "ERROR:": lambda rest: ErrorMessage(rest),
+    "LABEL": _preset_message,
+    "LABELS_CLEAR": lambda rest: _PRESETS_CLEAR_MESSAGE,
+    "MUTE": _mute_message,
+    "OK": lambda rest: _OK_MESSAGE,
+    "PROFILE": _source_message,
+    "PROFILES_CLEAR": lambda rest: _SOURCES_CLEAR_MESSAGE,
+    "SRATE": lambda rest: SamplingRateMessage(int(rest)),
+    "VOLUME": _volume_message,
+    "Welcome": _welcome_message,
+}
+
 
 class Message:
-    pass
+    __slots__ = ()
 
 
+@dataclass(frozen=True, slots=True)
 class AudiosyncMessage(Message):
-    def __init__(self, mode: str) -> None:
-        self.mode = mode
+    mode: str
 
 
+@dataclass(frozen=True, slots=True)
 class BypassMessage(Message):
-    def __init__(self, state: bool) -> None:
-        self.state = state
+    state: bool
 
 
+@dataclass(frozen=True, slots=True)
 class CurrentPresetMessage(Message):
-    def __init__(self, index: int) -> None:
-        self.index = index
+    index: int
 
 
+@dataclass(frozen=True, slots=True)
 class CurrentSourceFormat(Message):
-    def __init__(self, format: str) -> None:
-        self.format = format
+    format: str
 
 
+@dataclass(frozen=True, slots=True)
 class CurrentSourceMessage(Message):
-    def __init__(self, index: int) -> None:
-        self.index = index
+    index: int
 
 
+@dataclass(frozen=True, slots=True)
 class DecoderMessage(Message):
-    def __init__(
-        self, nonaudio: bool, playable: bool, decoder: str, upmixer: str
-    ) -> None:
-        self.nonaudio = nonaudio
-        self.playable = playable
-        self.decoder = decoder
-        self.upmixer = upmixer
+    nonaudio: bool
+    playable: bool
+    decoder: str
+    upmixer: str
 
 
+@dataclass(frozen=True, slots=True)
 class DimMessage(Message):
-    def __init__(self, state: bool) -> None:
-        self.state = state
+    state: bool
 
 
+@dataclass(frozen=True, slots=True)
 class ErrorMessage(Message):
-    def __init__(self, error: str) -> None:
-        self.error = error
+    error: str
 
 
+@dataclass(frozen=True, slots=True)
 class MuteMessage(Message):
-    def __init__(self, state: bool) -> None:
-        self.state = state
+    state: bool
 
 
+@dataclass(frozen=True, slots=True)
 class OKMessage(Message):
     pass
 
 
+@dataclass(frozen=True, slots=True)
 class PresetMessage(Message):
-    def __init__(self, index: int, name: str) -> None:
-        self.index = index
-        self.name = name
+    index: int
+    name: str
 
 
+@dataclass(frozen=True, slots=True)
 class PresetsClearMessage(Message):
     pass
 
 
+@dataclass(frozen=True, slots=True)
 class SamplingRateMessage(Message):
-    def __init__(self, rate: int) -> None:
-        self.rate = rate
+    rate: int
 
 
+@dataclass(frozen=True, slots=True)
 class SourceMessage(Message):
-    def __init__(self, index: int, name: str) -> None:
-        self.index = index
-        self.name = name
+    index: int
+    name: str
 
 
+@dataclass(frozen=True, slots=True)
 class SourcesClearMessage(Message):
     pass
 
 
+@dataclass(frozen=True, slots=True)
 class UnknownMessage(Message):
-    def __init__(self, raw_message: str) -> None:
-        self.raw_message = raw_message
+    raw_message: str
 
 
+@dataclass(frozen=True, slots=True)
 class VolumeMessage(Message):
-    def __init__(self, volume: float) -> None:
-        self.volume = volume
+    volume: float
 
 
+@dataclass(frozen=True, slots=True)
 class WelcomeMessage(Message):
-    def __init__(self, version: str, id: str) -> None:
-        self.version = version
-        self.id = id
+    version: str
+    id: str
+
+
+_OK_MESSAGE = OKMessage()
+_PRESETS_CLEAR_MESSAGE = PresetsClearMessage()
+_SOURCES_CLEAR_MESSAGE = SourcesClearMessage()
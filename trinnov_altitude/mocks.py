@@ -7,6 +7,12 @@ import logging
 import re
 from trinnov_altitude.trinnov_altitude import TrinnovAltitude
 
+# Argument patterns for the commands understood by the mock, which are
+# dispatched on their leading command word.
+_INDEX_PATTERN = re.compile(r"\d+")
+_NUMBER_PATTERN = re.compile(r"-?\d+(\.\d+)?")
+_STATE_PATTERN = re.compile(r"0|1|2")
+
 
 class MockTrinnovAltitudeServer:
     """
@@ -110,6 +116,14 @@ class MockTrinnovAltitudeServer:
         "CURRENT_PRESET -1",
     ]
 
+    # Encoded once when the class is created rather than on every connection
+    WELCOME_MESSAGE_ENCODED = (
+        b"Welcome on Trinnov Optimizer (Version 4.3.2rc1, ID 10485761)\n"
+    )
+    INITIAL_MESSAGES_ENCODED = "".join(
+        f"{message}\n" for message in INITIAL_MESSAGES
+    ).encode(ENCODING)
+
     def __init__(self, host=DEFAULT_HOST, port=TrinnovAltitude.DEFAULT_PORT):
         # Configuration
         self.host = host
@@ -119,6 +133,11 @@ class MockTrinnovAltitudeServer:
 
         # State
         self.active_handlers = set()
+        self.reset()
+
+    def reset(self):
+        """Restore the state of a freshly powered on processor."""
+        self.mute = False
         self.volume = -40
 
     async def start_server(self):
@@ -162,9 +181,7 @@ class MockTrinnovAltitudeServer:
         try:
             # When you connect to an Altitude it will send a welcome message with
             # the firmware vesion and ID of the unit.
-            writer.write(
-                b"Welcome on Trinnov Optimizer (Version 4.3.2rc1, ID 10485761)\n"
-            )
+            writer.write(self.WELCOME_MESSAGE_ENCODED)
             await writer.drain()
 
             # An actual Altitude will wait to send the initial state messages
@@ -172,9 +189,8 @@ class MockTrinnovAltitudeServer:
 
             # Upon connecting the Altitude will send a variety of messages reflecting
             # current state.
-            for message in self.INITIAL_MESSAGES:
-                writer.write(f"{message}\n".encode(self.ENCODING))
-                await writer.drain()
+            writer.write(self.INITIAL_MESSAGES_ENCODED)
+            await writer.drain()
 
             # Listen for messages
             while True:
@@ -192,9 +208,10 @@ class MockTrinnovAltitudeServer:
                 else:
                     responses = self._handle_message(message)
 
-                    for response in responses:
-                        writer.write(f"{response}\n".encode(self.ENCODING))
-                        await writer.drain()
+                    writer.writelines(
+                        f"{response}\n".encode(self.ENCODING) for response in responses
+                    )
+                    await writer.drain()
         except (asyncio.CancelledError, OSError):
             pass
         finally:
@@ -214,14 +231,22 @@ class MockTrinnovAltitudeServer:
     def _handle_message(self, message):
         self.logger.debug("Received message from client: %s", message)
 
-        if match := re.match(r"^dvolume\s(-?\d+(\.\d+)?)", message):
-            delta = float(match.group(1))
+        command, _, argument = message.partition(" ")
+
+        if command == "dvolume" and (match := _NUMBER_PATTERN.match(argument)):
+            delta = float(match.group(0))
             self.volume += delta
             return ["OK", f"VOLUME {self.volume}"]
-        if match := re.match(r"^id (.*)", message):
+        elif command == "id" and argument:
             return ["OK"]
-        elif match := re.match(r"^volume\s(-?\d+(\.\d+)?)", message):
-            self.volume = float(match.group(1))
+        elif command == "mute" and (match := _STATE_PATTERN.match(argument)):
+            state = match.group(0)
+            self.mute = not self.mute if state == "2" else state == "1"
+            return ["OK", f"MUTE {int(self.mute)}"]
+        elif command == "profile" and (match := _INDEX_PATTERN.match(argument)):
+            return ["OK", f"CURRENT_PROFILE {match.group(0)}"]
+        elif command == "volume" and (match := _NUMBER_PATTERN.match(argument)):
+            self.volume = float(match.group(0))
             return ["OK", f"VOLUME {self.volume}"]
         else:
             return [f"ERROR: invalid command: {message}"]
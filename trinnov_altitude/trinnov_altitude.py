@@ -5,14 +5,28 @@ Implements the Trinnov Altitude processor automation protocol over TCP/IP
 import asyncio
 from collections.abc import Callable
 import logging
-import re
-from typing import TypeAlias
+import socket
+from typing import Any, TypeAlias
 from wakeonlan import send_magic_packet
 
 from trinnov_altitude import const, exceptions, messages
 
+# The message is None for the "connected" and "disconnected" events
 Callback: TypeAlias = Callable[[str, messages.Message | None], None]
 
+_LOGGER = logging.getLogger(__name__)
+
+# Module-level alias of `TrinnovAltitude.USE_DEFAULT_TIMEOUT` for fast lookups
+_USE_DEFAULT_TIMEOUT = -1.0
+
+# Only available on Linux
+_TCP_QUICKACK: int | None = getattr(socket, "TCP_QUICKACK", None)
+
+# A Mac address is six hex octets separated by `:` or `-`,
+# e.g. `c8:7f:54:7a:eb:c2`
+_MAC_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_MAC_SEPARATORS = frozenset(":-")
+
 
 class TrinnovAltitude:
     """
@@ -25,12 +39,82 @@ class TrinnovAltitude:
     DEFAULT_PORT = 44100
     DEFAULT_TIMEOUT = 2.0
     ENCODING = "ascii"
+    # Longest line accepted from the processor, matching StreamReader's limit
+    READ_LIMIT = 2**16
+    READ_SIZE = 4096
     VOLUME_MIN = -120.0
     VOLUME_MAX = 20.0
 
+    # Scale factors between dB and percentage, computed once
+    _VOLUME_TO_PERCENTAGE = 100 / (VOLUME_MAX - VOLUME_MIN)
+    _PERCENTAGE_TO_VOLUME = (VOLUME_MAX - VOLUME_MIN) / 100
+
     # Use a sentinel value to signal that the DEFAULT_TIMEOUT should be used.
     # This allows users to pass None and disable the timeout to wait indefinitely.
-    USE_DEFAULT_TIMEOUT = -1.0
+    USE_DEFAULT_TIMEOUT = _USE_DEFAULT_TIMEOUT
+
+    # Encoded commands for on/off settings, indexed by the desired state so
+    # the `*_set` methods don't format or encode anything on every call.
+    _ACOUSTIC_CORRECTION_COMMANDS = (
+        b"use_acoustic_correct 0\n",
+        b"use_acoustic_correct 1\n",
+    )
+    _BYPASS_COMMANDS = (b"bypass 0\n", b"bypass 1\n")
+    _DIM_COMMANDS = (b"dim 0\n", b"dim 1\n")
+    # "fav_light 1" turns the front display off and "fav_light 0" turns it on
+    _FRONT_DISPLAY_COMMANDS = (b"fav_light 1\n", b"fav_light 0\n")
+    _LEVEL_ALIGNMENT_COMMANDS = (b"use_level_alignment 0\n", b"use_level_alignment 1\n")
+    _MUTE_COMMANDS = (b"mute 0\n", b"mute 1\n")
+    _QUICK_OPTIMIZED_COMMANDS = (b"quick_optimized 0\n", b"quick_optimized 1\n")
+    _TIME_ALIGNMENT_COMMANDS = (b"use_time_alignment 0\n", b"use_time_alignment 1\n")
+
+    # State that only holds while connected, see `_reset_state`
+    audiosync: str | None
+    bypass: bool | None
+    decoder: str | None
+    dim: bool | None
+    mute: bool | None
+    source_format: str | None
+    upmixer: str | None
+    volume: float | None
+    # Indexes of the current preset and source, resolved to their names
+    # by the `preset` and `source` properties.
+    _preset_index: int | None
+    _source_index: int | None
+
+    # Attributes cleared by `_reset_state`. Presets, sources and the
+    # processor's identity are kept.
+    _RESETTABLE_STATE = (
+        "audiosync",
+        "bypass",
+        "decoder",
+        "dim",
+        "mute",
+        "_preset_index",
+        "_source_index",
+        "source_format",
+        "upmixer",
+        "volume",
+    )
+
+    # Parts of the state required for the initial sync, see `_mark_synced`
+    _SYNC_WELCOME = 1  # id and version
+    _SYNC_PRESETS = 2
+    _SYNC_SOURCES = 4
+    _SYNC_COMPLETE = _SYNC_WELCOME | _SYNC_PRESETS | _SYNC_SOURCES
+
+    # Commands without arguments, encoded once
+    _ACOUSTIC_CORRECTION_TOGGLE_COMMAND = b"use_acoustic_correct 2\n"
+    _BYPASS_TOGGLE_COMMAND = b"bypass 2\n"
+    _DIM_TOGGLE_COMMAND = b"dim 2\n"
+    _FRONT_DISPLAY_TOGGLE_COMMAND = b"fav_light 2\n"
+    _LEVEL_ALIGNMENT_TOGGLE_COMMAND = b"use_level_alignment 2\n"
+    _MUTE_TOGGLE_COMMAND = b"mute 2\n"
+    _POWER_OFF_COMMAND = b"power_off_SECURED_FHZMCH48FE\n"
+    _PRESET_GET_COMMAND = b"get_current_preset\n"
+    _QUICK_OPTIMIZED_TOGGLE_COMMAND = b"quick_optimized 2\n"
+    _SOURCE_GET_COMMAND = b"get_current_profile\n"
+    _TIME_ALIGNMENT_TOGGLE_COMMAND = b"use_time_alignment 2\n"
 
     @classmethod
     def validate_mac(cls, mac_address):
@@ -39,11 +123,14 @@ class TrinnovAltitude:
         valid Trinnov Altitude Mac address.
         ."""
 
-        normalized_mac_address = mac_address.lower()
-
-        # Verify the format
-        pattern = re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$")
-        if pattern.match(normalized_mac_address) is None:
+        # Verify the format: separators at every third position and hex
+        # digits (in either case) everywhere else.
+        if (
+            len(mac_address) != 17
+            or not _MAC_SEPARATORS.issuperset(mac_address[2::3])
+            or not _MAC_HEX_DIGITS.issuperset(mac_address[0::3])
+            or not _MAC_HEX_DIGITS.issuperset(mac_address[1::3])
+        ):
             raise exceptions.MalformedMacAddressError(mac_address)
 
         return True
@@ -55,7 +142,7 @@ class TrinnovAltitude:
         mac: str | None = None,
         client_id: str = DEFAULT_CLIENT_ID,
         timeout: float = DEFAULT_TIMEOUT,
-        logger: logging.Logger = logging.getLogger(__name__),
+        logger: logging.Logger | None = None,
     ):
         if mac is not None:
             self.__class__.validate_mac(mac)
@@ -66,27 +153,28 @@ class TrinnovAltitude:
         self.mac = mac
         self.client_id = client_id
         self.timeout = timeout
-        self.logger = logger
+        self.logger = logger if logger is not None else _LOGGER
 
         # State
-        self.audiosync: str | None = None
-        self.bypass: bool | None = None
-        self.decoder: str | None = None
-        self.dim: bool | None = None
+        self._reset_state()
         self.id: str | None = None
-        self.mute: bool | None = None
-        self.preset: str | None = None
         self.presets: dict[int, str] = {}
-        self.source: str | None = None
-        self.source_format: str | None = None
         self.sources: dict[int, str] = {}
-        self.upmixer: str | None = None
+        # Reverse index of `sources`, the first id is kept for duplicate names.
+        # Built on first use and dropped whenever `sources` changes.
+        self._source_ids_by_name: dict[str, int] | None = None
         self.version: str | None = None
-        self.volume: float | None = None
 
         # Utility
         self._callbacks: set[Callback] = set()
+        # Immutable copy of `_callbacks` used when firing events, rebuilt only
+        # when callbacks are (de)registered. Callbacks may then (de)register
+        # callbacks while an event is being dispatched.
+        self._callbacks_snapshot: tuple[Callback, ...] = ()
         self._initial_sync = asyncio.Event()
+        self._sync_state = 0
+        self._quickack_socket: Any = None
+        self._read_buffer = bytearray()
         self._reader: asyncio.StreamReader | None = None
         self._response_handler_task: asyncio.Task | None = None
         self._writer: asyncio.StreamWriter | None = None
@@ -98,14 +186,14 @@ class TrinnovAltitude:
     async def connect(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
         """Initiates the TCP connection to the processor"""
         if self.connected():
-            self.logger.warn(
+            self.logger.warning(
                 "Trinnov Altitude already connected, use `reconnect` to establish a new connection"
             )
             return
 
         self.logger.info("Connecting to Trinnov Altitude: %s:%s", self.host, self.port)
 
-        if timeout is self.USE_DEFAULT_TIMEOUT:
+        if timeout is _USE_DEFAULT_TIMEOUT:
             timeout = self.timeout
 
         try:
@@ -117,6 +205,13 @@ class TrinnovAltitude:
         except (OSError, ValueError) as e:
             raise exceptions.ConnectionFailedError(e)
         else:
+            self._set_socket_options()
+
+            # Commands are tiny, so have `drain` wait until they have been
+            # handed to the kernel rather than returning while they are
+            # still buffered in the transport.
+            self._writer.transport.set_write_buffer_limits(high=0)
+
             # Default these values since the Trinnov Altitude will only
             # send them upon connect if they are active.
             self.bypass = False
@@ -124,13 +219,18 @@ class TrinnovAltitude:
             self.mute = False
 
             # Fire the callback to signal a connection state change
-            for callback in self._callbacks:
+            for callback in self._callbacks_snapshot:
                 callback("connected", None)
 
-            await self._write(f"id {self.client_id}", timeout)
-            await self._write("send volume", timeout)
-            await self.preset_get(timeout)
-            await self.source_get(timeout)
+            # Identify ourselves and request the current state in a single
+            # write rather than one write and drain per command.
+            identify = f"id {self.client_id}\nsend volume\n".encode(self.ENCODING)
+            await self._write_bytes(
+                b"".join(
+                    (identify, self._PRESET_GET_COMMAND, self._SOURCE_GET_COMMAND)
+                ),
+                timeout,
+            )
 
     def connected(self) -> bool:
         """Returns the connection state."""
@@ -141,6 +241,7 @@ class TrinnovAltitude:
         Deregister a callback.
         """
         self._callbacks.remove(callback)
+        self._callbacks_snapshot = tuple(self._callbacks)
 
     async def disconnect(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
         """Closes the TCP connection to the processor"""
@@ -148,27 +249,19 @@ class TrinnovAltitude:
             self.logger.warning("Not connected to Trinnov Altitude, can't disconnect")
             return
 
-        if timeout is self.USE_DEFAULT_TIMEOUT:
+        if timeout is _USE_DEFAULT_TIMEOUT:
             timeout = self.timeout
 
         self._writer.close()
+        self._quickack_socket = None
+        self._read_buffer.clear()
         self._reader = None
         self._writer = None
 
-        # Reset state
-        self.audiosync = None
-        self.bypass = None
-        self.decoder = None
-        self.dim = None
-        self.mute = None
-        self.preset = None
-        self.source = None
-        self.source_format = None
-        self.upmixer = None
-        self.volume = None
+        self._reset_state()
 
         # Fire the callback to signal a connection state change
-        for callback in self._callbacks:
+        for callback in self._callbacks_snapshot:
             callback("disconnected", None)
 
     async def reconnect(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
@@ -190,6 +283,7 @@ class TrinnovAltitude:
         the processor.
         """
         self._callbacks.add(callback)
+        self._callbacks_snapshot = tuple(self._callbacks)
 
     def start_listening(
         self,
@@ -201,12 +295,12 @@ class TrinnovAltitude:
             self.register_callback(callback)
 
         self._response_handler_task = asyncio.create_task(
-            self._listen(reconnect, backoff)
+            self._listen(reconnect=reconnect, reconnect_backoff=backoff)
         )
 
     async def stop_listening(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
         if self._response_handler_task:
-            if timeout is self.USE_DEFAULT_TIMEOUT:
+            if timeout is _USE_DEFAULT_TIMEOUT:
                 timeout = self.timeout
 
             self._response_handler_task.cancel()
@@ -230,13 +324,28 @@ class TrinnovAltitude:
     # --------------------------
     # Properties
     # --------------------------
+
+    @property
+    def preset(self) -> str | None:
+        """The name of the current preset."""
+        if self._preset_index is None:
+            return None
+
+        return self.presets.get(self._preset_index)
+
+    @property
+    def source(self) -> str | None:
+        """The name of the current source."""
+        if self._source_index is None:
+            return None
+
+        return self.sources.get(self._source_index)
+
     def volume_percentage(self) -> float | None:
         if self.volume is None:
             return None
 
-        return (
-            (self.volume - self.VOLUME_MIN) / (self.VOLUME_MAX - self.VOLUME_MIN)
-        ) * 100
+        return (self.volume - self.VOLUME_MIN) * self._VOLUME_TO_PERCENTAGE
 
     # --------------------------
     # Commands
@@ -248,7 +357,7 @@ class TrinnovAltitude:
         """
         Turn the acoustic correction off.
         """
-        await self.acoustic_correction_set(False)
+        await self.acoustic_correction_set(False, timeout)
 
     async def acoustic_correction_on(
         self, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -256,7 +365,7 @@ class TrinnovAltitude:
         """
         Turn the acoustic correction on.
         """
-        await self.acoustic_correction_set(True)
+        await self.acoustic_correction_set(True, timeout)
 
     async def acoustic_correction_set(
         self, state: bool, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -264,7 +373,7 @@ class TrinnovAltitude:
         """
         Set the acoustic correction to On (True) or Off (False)
         """
-        await self._write(f"use_acoustic_correct {int(state)}", timeout)
+        await self._write_bool(self._ACOUSTIC_CORRECTION_COMMANDS, state, timeout)
 
     async def acoustic_correction_toggle(
         self, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -272,19 +381,19 @@ class TrinnovAltitude:
         """
         Toggle the acoustic correction state.
         """
-        await self._write("use_acoustic_correct 2", timeout)
+        await self._write_bytes(self._ACOUSTIC_CORRECTION_TOGGLE_COMMAND, timeout)
 
     async def bypass_off(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
         """
         Turn the bypass off
         """
-        await self.bypass_set(False)
+        await self.bypass_set(False, timeout)
 
     async def bypass_on(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
         """
         Turn the bypass on
         """
-        await self.bypass_set(True)
+        await self.bypass_set(True, timeout)
 
     async def bypass_set(
         self, state: bool, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -292,25 +401,25 @@ class TrinnovAltitude:
         """
         Set the bypass state to On (True) or Off (False)
         """
-        await self._write(f"bypass {int(state)}", timeout)
+        await self._write_bool(self._BYPASS_COMMANDS, state, timeout)
 
     async def bypass_toggle(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
         """
         Toggle the bypass state.
         """
-        await self._write("bypass 2", timeout)
+        await self._write_bytes(self._BYPASS_TOGGLE_COMMAND, timeout)
 
     async def dim_off(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
         """
         Turn the dim off.
         """
-        await self.dim_set(False)
+        await self.dim_set(False, timeout)
 
     async def dim_on(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
         """
         Turn the dim on.
         """
-        await self.dim_set(True)
+        await self.dim_set(True, timeout)
 
     async def dim_set(
         self, state: bool, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -318,13 +427,13 @@ class TrinnovAltitude:
         """
         Set the dim state to On (True) or Off (False)
         """
-        await self._write(f"dim {int(state)}", timeout)
+        await self._write_bool(self._DIM_COMMANDS, state, timeout)
 
     async def dim_toggle(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
         """
         Toggle the dim state.
         """
-        await self._write("dim 2", timeout)
+        await self._write_bytes(self._DIM_TOGGLE_COMMAND, timeout)
 
     async def front_display_off(
         self, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -332,13 +441,13 @@ class TrinnovAltitude:
         """
         Turn the front display off.
         """
-        await self.front_display_set(False)
+        await self.front_display_set(False, timeout)
 
     async def front_display_on(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
         """
         Turn the front display on.
         """
-        await self.front_display_set(True)
+        await self.front_display_set(True, timeout)
 
     async def front_display_set(
         self, state: bool, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -346,7 +455,7 @@ class TrinnovAltitude:
         """
         Set the front display of the processor to On (True) or Off (False).
         """
-        await self._write(f"fav_light {int(state)}", timeout)
+        await self._write_bool(self._FRONT_DISPLAY_COMMANDS, state, timeout)
 
     async def front_display_toggle(
         self, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -354,7 +463,7 @@ class TrinnovAltitude:
         """
         Toggle the front display of the processor.
         """
-        await self._write("dim 2", timeout)
+        await self._write_bytes(self._FRONT_DISPLAY_TOGGLE_COMMAND, timeout)
 
     async def level_alignment_off(
         self, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -362,7 +471,7 @@ class TrinnovAltitude:
         """
         Turn the level alignment off.
         """
-        await self.level_alignment_set(False)
+        await self.level_alignment_set(False, timeout)
 
     async def level_alignment_on(
         self, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -370,7 +479,7 @@ class TrinnovAltitude:
         """
         Turn the level alignment on.
         """
-        await self.level_alignment_set(True)
+        await self.level_alignment_set(True, timeout)
 
     async def level_alignment_set(
         self, state: bool, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -378,27 +487,27 @@ class TrinnovAltitude:
         """
         Set the level alignment state to On (True) or Off (False)
         """
-        await self._write(f"use_level_alignment {int(state)}", timeout)
+        await self._write_bool(self._LEVEL_ALIGNMENT_COMMANDS, state, timeout)
 
     async def level_alignment_toggle(
-        self, state, timeout: int | float | None = USE_DEFAULT_TIMEOUT
+        self, timeout: int | float | None = USE_DEFAULT_TIMEOUT
     ):
         """
         Toggle the level alignment state.
         """
-        await self._write("use_level_alignment 2", timeout)
+        await self._write_bytes(self._LEVEL_ALIGNMENT_TOGGLE_COMMAND, timeout)
 
     async def mute_off(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
         """
         Turn the mute off.
         """
-        await self.mute_set(False)
+        await self.mute_set(False, timeout)
 
     async def mute_on(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
         """
         Turn the mute on.
         """
-        await self.mute_set(True)
+        await self.mute_set(True, timeout)
 
     async def mute_set(
         self, state: bool, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -406,15 +515,13 @@ class TrinnovAltitude:
         """
         Set the mute state to On (True) or Off (False)
         """
-        await self._write(f"mute {int(state)}", timeout)
+        await self._write_bool(self._MUTE_COMMANDS, state, timeout)
 
-    async def mute_toggle(
-        self, state, timeout: int | float | None = USE_DEFAULT_TIMEOUT
-    ):
+    async def mute_toggle(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
         """
         Toggle the mute state.
         """
-        await self._write("mute 2", timeout)
+        await self._write_bytes(self._MUTE_TOGGLE_COMMAND, timeout)
 
     async def page_adjust(
         self, delta: int, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -429,17 +536,17 @@ class TrinnovAltitude:
         """
         Changes the menu page currently on the GUI down by one page.
         """
-        await self.page_adjust(-1)
+        await self.page_adjust(-1, timeout)
 
     async def page_up(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
         """
         Changes the menu page currently on the GUI up by one page.
         """
-        await self.page_adjust(1)
+        await self.page_adjust(1, timeout)
 
     async def power_off(self, timeout: int | float | None = USE_DEFAULT_TIMEOUT):
         """Power off."""
-        await self._write("power_off_SECURED_FHZMCH48FE", timeout)
+        await self._write_bytes(self._POWER_OFF_COMMAND, timeout)
 
     def power_on(self):
         """Power on."""
@@ -460,7 +567,7 @@ class TrinnovAltitude:
         """
         Requests the current present.
         """
-        await self._write("get_current_preset", timeout)
+        await self._write_bytes(self._PRESET_GET_COMMAND, timeout)
 
     async def preset_set(
         self, id: int, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -477,7 +584,7 @@ class TrinnovAltitude:
         """
         Turn quick optimized off.
         """
-        await self.quick_optimized_set(False)
+        await self.quick_optimized_set(False, timeout)
 
     async def quick_optimized_on(
         self, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -485,7 +592,7 @@ class TrinnovAltitude:
         """
         Turn quick optimized on.
         """
-        await self.quick_optimized_set(True)
+        await self.quick_optimized_set(True, timeout)
 
     async def quick_optimized_set(
         self, state: bool, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -493,15 +600,15 @@ class TrinnovAltitude:
         """
         Set the quick optimized state to On (True) or Off (False)
         """
-        await self._write(f"quick_optimized {int(state)}", timeout)
+        await self._write_bool(self._QUICK_OPTIMIZED_COMMANDS, state, timeout)
 
     async def quick_optimized_toggle(
-        self, state, timeout: int | float | None = USE_DEFAULT_TIMEOUT
+        self, timeout: int | float | None = USE_DEFAULT_TIMEOUT
     ):
         """
         Toggle the quick optimized state.
         """
-        await self._write("quick_optimized 2", timeout)
+        await self._write_bytes(self._QUICK_OPTIMIZED_TOGGLE_COMMAND, timeout)
 
     async def remapping_mode_set(
         self,
@@ -518,7 +625,7 @@ class TrinnovAltitude:
         """
         Requests the current source.
         """
-        await self._write("get_current_profile", timeout)
+        await self._write_bytes(self._SOURCE_GET_COMMAND, timeout)
 
     async def source_set(
         self, id: int, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -534,10 +641,14 @@ class TrinnovAltitude:
         """
         Set the source identified by `name` from `sources`.
         """
-        for source_id, source_name in self.sources.items():
-            if source_name == name:
-                await self.source_set(source_id)
-                return
+        if self._source_ids_by_name is None:
+            self._source_ids_by_name = {}
+            for source_id, source_name in self.sources.items():
+                self._source_ids_by_name.setdefault(source_name, source_id)
+
+        source_id = self._source_ids_by_name.get(name)
+        if source_id is not None:
+            await self.source_set(source_id, timeout)
 
     async def time_alignment_off(
         self, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -545,7 +656,7 @@ class TrinnovAltitude:
         """
         Turn time alignment off.
         """
-        await self.time_alignment_set(False)
+        await self.time_alignment_set(False, timeout)
 
     async def time_alignment_on(
         self, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -553,7 +664,7 @@ class TrinnovAltitude:
         """
         Turn time alignment on.
         """
-        await self.time_alignment_set(True)
+        await self.time_alignment_set(True, timeout)
 
     async def time_alignment_set(
         self, state: bool, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -561,15 +672,15 @@ class TrinnovAltitude:
         """
         Set the time alignment state to On (True) or Off (False)
         """
-        await self._write(f"use_time_alignment {int(state)}", timeout)
+        await self._write_bool(self._TIME_ALIGNMENT_COMMANDS, state, timeout)
 
     async def time_alignment_toggle(
-        self, state, timeout: int | float | None = USE_DEFAULT_TIMEOUT
+        self, timeout: int | float | None = USE_DEFAULT_TIMEOUT
     ):
         """
         Toggle the time alignment state.
         """
-        await self._write("use_time_alignment 2", timeout)
+        await self._write_bytes(self._TIME_ALIGNMENT_TOGGLE_COMMAND, timeout)
 
     async def upmixer_set(
         self, mode: const.UpmixerMode, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -578,7 +689,7 @@ class TrinnovAltitude:
         Set the upmixer mode. See `const.UpmixerMode` for available options
         and descriptions.
         """
-        await self._write(f"remapping_mode {mode.value}", timeout)
+        await self._write(f"upmixer {mode.value}", timeout)
 
     async def volume_adjust(
         self, delta: int | float, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -594,7 +705,9 @@ class TrinnovAltitude:
         """
         await self.volume_adjust(-0.5, timeout)
 
-    async def volume_percentage_set(self, percentage: float):
+    async def volume_percentage_set(
+        self, percentage: float, timeout: int | float | None = USE_DEFAULT_TIMEOUT
+    ):
         """
         Set the volume based on a percentage.
         """
@@ -602,12 +715,10 @@ class TrinnovAltitude:
             raise ValueError("Percentage must be between 0 and 100")
 
         # Calculate the corresponding volume level from the percentage
-        volume = (
-            (percentage / 100) * (self.VOLUME_MAX - self.VOLUME_MIN)
-        ) + self.VOLUME_MIN
+        volume = percentage * self._PERCENTAGE_TO_VOLUME + self.VOLUME_MIN
         volume = round(volume, 1)
 
-        await self.volume_set(volume)
+        await self.volume_set(volume, timeout)
 
     async def volume_set(
         self, db: int | float, timeout: int | float | None = USE_DEFAULT_TIMEOUT
@@ -639,7 +750,7 @@ class TrinnovAltitude:
     # --------------------------
     async def _listen(
         self,
-        read_timeout: float = 30.0,
+        read_timeout: float | None = None,
         read_backoff: float = 1.0,
         reconnect: bool = True,
         reconnect_timeout: float = 2.0,
@@ -648,8 +759,9 @@ class TrinnovAltitude:
         """
         Listen for messages and sync internal state
 
-        This method will automatically reconnect when necessary if `reconnect`
-        is set to `True`.
+        Reads block until the processor sends a message unless a
+        `read_timeout` is given. This method will automatically reconnect when
+        necessary if `reconnect` is set to `True`.
         """
         try:
             while True:
@@ -657,13 +769,15 @@ class TrinnovAltitude:
                     await self._read(read_timeout)
                 except asyncio.TimeoutError:
                     self.logger.debug(
-                        f"Read operation timed out, trying again in {read_backoff} seconds"
+                        "Read operation timed out, trying again in %s seconds",
+                        read_backoff,
                     )
                     await asyncio.sleep(read_backoff)
                 except (exceptions.NotConnectedError, EOFError, OSError) as e:
                     if reconnect:
                         self.logger.debug(
-                            f"Unable to read message from Trinnov Altitude, reconnecting...: {e}",
+                            "Unable to read message from Trinnov Altitude, reconnecting...: %s",
+                            e,
                         )
 
                         try:
@@ -674,7 +788,9 @@ class TrinnovAltitude:
                             exceptions.ConnectionFailedError,
                         ) as e:
                             self.logger.debug(
-                                f"Trinnov Altitude reconnect failed, trying again in {reconnect_backoff} seconds...: {e}"
+                                "Trinnov Altitude reconnect failed, trying again in %s seconds...: %s",
+                                reconnect_backoff,
+                                e,
                             )
                             await asyncio.sleep(reconnect_backoff)
                     else:
@@ -684,106 +800,285 @@ class TrinnovAltitude:
                 "Trinnov Altitude listen task received cancel, shutting down..."
             )
 
-    def _process_message(self, raw_message: str) -> messages.Message:  # noqa: C901
+    def _process_message(self, raw_message: str) -> messages.Message:
         """Receive a single message off of the socket and process it."""
-        print(raw_message)
         message = messages.message_factory(raw_message)
 
-        if isinstance(message, messages.AudiosyncMessage):
-            self.audiosync = message.mode
-        elif isinstance(message, messages.BypassMessage):
-            self.bypass = message.state
-        elif isinstance(message, messages.CurrentPresetMessage):
-            self.preset = self.presets.get(message.index)
-        elif isinstance(message, messages.CurrentSourceFormat):
-            self.source_format = message.format
-        elif isinstance(message, messages.CurrentSourceMessage):
-            self.source = self.sources.get(message.index)
-        elif isinstance(message, messages.DecoderMessage):
-            self.decoder = message.decoder
-            self.upmixer = message.upmixer
-        elif isinstance(message, messages.DimMessage):
-            self.dim = message.state
-        elif isinstance(message, messages.ErrorMessage):
-            self.logger.error(
-                f"Received error message from Trinnov Altitude: {message.error}"
-            )
-        elif isinstance(message, messages.PresetMessage):
-            self.presets[message.index] = message.name
-        elif isinstance(message, messages.PresetsClearMessage):
-            self.presets = {}
-        elif isinstance(message, messages.MuteMessage):
-            self.mute = message.state
-        elif isinstance(message, messages.SourceMessage):
-            self.sources[message.index] = message.name
-        elif isinstance(message, messages.SourcesClearMessage):
-            self.sources = {}
-        elif isinstance(message, messages.SamplingRateMessage):
-            self.sampling_rate = message.rate
-        elif isinstance(message, messages.VolumeMessage):
-            self.volume = message.volume
-        elif isinstance(message, messages.WelcomeMessage):
-            self.version = message.version
-            self.id = message.id
-
-        if message is not None:
-            for callback in self._callbacks:
-                callback("received_message", message)
+        handler = self._MESSAGE_HANDLERS.get(type(message))
+        if handler is not None:
+            handler(self, message)
 
-        if (
-            not self._initial_sync.is_set()
-            and self.id is not None
-            and self.presets != {}
-            and self.sources != {}
-            and self.version is not None
-        ):
-            self._initial_sync.set()
+        for callback in self._callbacks_snapshot:
+            callback("received_message", message)
 
         return message
 
     async def _read(
         self, timeout: int | float | None = USE_DEFAULT_TIMEOUT
-    ) -> None | messages.Message:
-        """Read a single raw message off of the socket"""
+    ) -> list[messages.Message]:
+        """
+        Read the data available on the socket and process every complete
+        message in it.
+
+        The processor sends bursts of messages (e.g. the preset and source
+        lists on connect), so this handles a whole burst per read rather than
+        awaiting each line separately. Incomplete trailing data is kept until
+        the next read.
+        """
         if self._reader is None:
             raise exceptions.NotConnectedError()
 
-        if timeout is self.USE_DEFAULT_TIMEOUT:
+        if timeout is _USE_DEFAULT_TIMEOUT:
             timeout = self.timeout
 
-        raw_message = await asyncio.wait_for(self._reader.readline(), timeout)
+        # The listener reads without a timeout, so skip the `wait_for` wrapper
+        # (and its timer bookkeeping) entirely in that case.
+        if timeout is None:
+            data = await self._reader.read(self.READ_SIZE)
+        else:
+            data = await asyncio.wait_for(self._reader.read(self.READ_SIZE), timeout)
 
-        if raw_message == b"":
+        if data == b"":
             self.logger.debug(
                 "Received EOF from Trinnov Altitude, closing connection..."
             )
             await self.disconnect()
             raise exceptions.NotConnectedError()
-        else:
-            raw_message = raw_message.decode().rstrip()
-            self.logger.debug(f"Received message from Trinnov Altitude: {raw_message}")
-            return self._process_message(raw_message)
+
+        self._rearm_quickack()
+        raw_messages = self._split_lines(data)
+
+        # Check the log level once per read rather than once per message
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        processed = []
+        for raw_message in raw_messages:
+            raw_message = raw_message.rstrip().decode()
+            if debug:
+                self.logger.debug(
+                    "Received message from Trinnov Altitude: %s", raw_message
+                )
+            processed.append(self._process_message(raw_message))
+
+        # Complete lines from this read have been processed above, only the
+        # overlong partial line is lost.
+        if len(self._read_buffer) > self.READ_LIMIT:
+            self.logger.warning(
+                "Received a line longer than %s bytes from Trinnov Altitude, closing connection...",
+                self.READ_LIMIT,
+            )
+            await self.disconnect()
+            raise exceptions.NotConnectedError()
+
+        return processed
+
+    def _rearm_quickack(self):
+        """
+        Re-enable TCP_QUICKACK after receiving data.
+
+        TCP_QUICKACK is not sticky, the kernel may fall back to delayed ACKs
+        after a while, so it is re-armed whenever data has been received.
+        """
+        if self._quickack_socket is not None:
+            try:
+                self._quickack_socket.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+            except OSError:
+                self._quickack_socket = None
+
+    def _reset_state(self):
+        """Clear the state that only holds while connected."""
+        for name in self._RESETTABLE_STATE:
+            setattr(self, name, None)
+
+    def _split_lines(self, data: bytes) -> list[bytes]:
+        """
+        Split received data into complete lines, keeping the trailing partial
+        line in the read buffer.
+
+        Only the new data is split, its first line is joined with any partial
+        line left over from previous reads, so pending data is never re-copied.
+        """
+        *lines, partial = data.split(b"\n")
+        if lines and self._read_buffer:
+            self._read_buffer += lines[0]
+            lines[0] = bytes(self._read_buffer)
+            self._read_buffer.clear()
+        self._read_buffer += partial
+        return lines
+
+    def _set_socket_options(self):
+        """
+        Tune the connection for the protocol's small request/response messages.
+
+        Nagle's algorithm would hold back short commands until the previous
+        one is acknowledged, so make sure it is disabled regardless of the
+        event loop's defaults. On Linux, also ask for immediate ACKs so the
+        processor isn't left waiting on our delayed-ACK timer.
+        """
+        sock = self._writer.get_extra_info("socket") if self._writer else None
+        if sock is None:
+            return
+
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            self.logger.debug("Unable to set TCP_NODELAY: %s", e)
+
+        if _TCP_QUICKACK is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+            except OSError as e:
+                self.logger.debug("Unable to set TCP_QUICKACK: %s", e)
+            else:
+                self._quickack_socket = sock
 
     async def _write(self, message: str, timeout: float | None):
-        """Write a single message to the socket"""
+        """
+        Write a message to the socket. Multiple commands can be sent at once
+        by separating them with newlines.
+        """
+        message_bytes = message.encode(self.ENCODING)
+
+        # Pass the terminator separately instead of copying the message to
+        # append it, the transport can send both buffers in one call.
+        terminator = b"" if message_bytes.endswith(b"\n") else b"\n"
+        await self._write_bytes(message_bytes, timeout, terminator)
+
+    async def _write_bool(
+        self,
+        commands: tuple[bytes, bytes],
+        state: bool,
+        timeout: float | None,
+    ):
+        """
+        Write the command from an encoded `(off, on)` pair that matches the
+        truthiness of `state`.
+        """
+        await self._write_bytes(commands[bool(state)], timeout)
+
+    async def _write_bytes(
+        self, data: bytes, timeout: float | None, terminator: bytes = b""
+    ):
+        """
+        Write already encoded, newline terminated, data to the socket. This is
+        used directly for the fixed commands, which are encoded once.
+        """
         if self._writer is None:
             raise exceptions.NotConnectedError()
 
-        if timeout is self.USE_DEFAULT_TIMEOUT:
+        if timeout is _USE_DEFAULT_TIMEOUT:
             timeout = self.timeout
 
-        if not message.endswith("\n"):
-            message += "\n"
-
-        message_bytes = message.encode(self.ENCODING)
-        self._writer.write(message_bytes)
+        if terminator:
+            self._writer.writelines((data, terminator))
+        else:
+            self._writer.write(data)
 
         try:
             await asyncio.wait_for(self._writer.drain(), timeout=timeout)
-            self.logger.debug(f"Sent to Trinnov Altitude: {message.rstrip()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Sent to Trinnov Altitude: %s", data.rstrip().decode(self.ENCODING)
+                )
         except OSError as e:
             self.logger.debug(
-                f"Encountered connection error while writing to Trinnov Altitude, closing connection...: {e}"
+                "Encountered connection error while writing to Trinnov Altitude, closing connection...: %s",
+                e,
             )
             await self.disconnect()
             raise exceptions.NotConnectedError()
+
+    # --------------------------
+    # Message handlers
+    # --------------------------
+
+    def _mark_synced(self, part: int):
+        """
+        Record that a part of the initial state has been received and signal
+        the initial sync once all parts are in. Only the messages providing
+        those parts call this, so other messages skip the check entirely.
+        """
+        self._sync_state |= part
+        if self._sync_state == self._SYNC_COMPLETE:
+            self._initial_sync.set()
+
+    def _handle_audiosync(self, message: messages.AudiosyncMessage):
+        self.audiosync = message.mode
+
+    def _handle_bypass(self, message: messages.BypassMessage):
+        self.bypass = message.state
+
+    def _handle_current_preset(self, message: messages.CurrentPresetMessage):
+        self._preset_index = message.index
+
+    def _handle_current_source_format(self, message: messages.CurrentSourceFormat):
+        self.source_format = message.format
+
+    def _handle_current_source(self, message: messages.CurrentSourceMessage):
+        self._source_index = message.index
+
+    def _handle_decoder(self, message: messages.DecoderMessage):
+        self.decoder = message.decoder
+        self.upmixer = message.upmixer
+
+    def _handle_dim(self, message: messages.DimMessage):
+        self.dim = message.state
+
+    def _handle_error(self, message: messages.ErrorMessage):
+        self.logger.error(
+            "Received error message from Trinnov Altitude: %s", message.error
+        )
+
+    def _handle_mute(self, message: messages.MuteMessage):
+        self.mute = message.state
+
+    def _handle_preset(self, message: messages.PresetMessage):
+        self.presets[message.index] = message.name
+        self._mark_synced(self._SYNC_PRESETS)
+
+    def _handle_presets_clear(self, message: messages.PresetsClearMessage):
+        self.presets = {}
+        self._sync_state &= ~self._SYNC_PRESETS
+
+    def _handle_sampling_rate(self, message: messages.SamplingRateMessage):
+        self.sampling_rate = message.rate
+
+    def _handle_source(self, message: messages.SourceMessage):
+        if self.sources.get(message.index) != message.name:
+            self.sources[message.index] = message.name
+            self._source_ids_by_name = None
+        self._mark_synced(self._SYNC_SOURCES)
+
+    def _handle_sources_clear(self, message: messages.SourcesClearMessage):
+        self.sources = {}
+        self._source_ids_by_name = None
+        self._sync_state &= ~self._SYNC_SOURCES
+
+    def _handle_volume(self, message: messages.VolumeMessage):
+        self.volume = message.volume
+
+    def _handle_welcome(self, message: messages.WelcomeMessage):
+        self.version = message.version
+        self.id = message.id
+        self._mark_synced(self._SYNC_WELCOME)
+
+    # Maps each message type to the handler applying it to the client state,
+    # so processing a message is a single lookup instead of an isinstance
+    # chain. Messages without an entry don't affect state.
+    _MESSAGE_HANDLERS: dict[type, Callable[["TrinnovAltitude", Any], None]] = {
+        messages.AudiosyncMessage: _handle_audiosync,
+        messages.BypassMessage: _handle_bypass,
+        messages.CurrentPresetMessage: _handle_current_preset,
+        messages.CurrentSourceFormat: _handle_current_source_format,
+        messages.CurrentSourceMessage: _handle_current_source,
+        messages.DecoderMessage: _handle_decoder,
+        messages.DimMessage: _handle_dim,
+        messages.ErrorMessage: _handle_error,
+        messages.MuteMessage: _handle_mute,
+        messages.PresetMessage: _handle_preset,
+        messages.PresetsClearMessage: _handle_presets_clear,
+        messages.SamplingRateMessage: _handle_sampling_rate,
+        messages.SourceMessage: _handle_source,
+        messages.SourcesClearMessage: _handle_sources_clear,
+        messages.VolumeMessage: _handle_volume,
+        messages.WelcomeMessage: _handle_welcome,
+    }